@@ -4,7 +4,7 @@ Inventory System (Mini - Upgraded)
 Features:
 - Login (username + password) - L1 simple UI
 - Products CRUD: Add / Update / Delete
-- Live search (name/category)
+- Live search (name/category prefix; use % for "contains")
 - Export to CSV and Excel (.xlsx)
 - Dashboard with totals and top-categories chart (Matplotlib embedded)
 - SQLite DB auto-created: mini_inventory.db
@@ -14,78 +14,139 @@ Run:
     python inventory_system.py
 
 Dependencies:
-    pip install PyQt5 pandas matplotlib openpyxl
+    pip install PyQt5 matplotlib openpyxl
 
 If you don't want Excel export, openpyxl is optional (CSV will still work).
 """
 import sys
 import os
 import sqlite3
+import csv
 import hashlib
+import hmac
+import threading
 from datetime import datetime
-from collections import Counter
 
 from PyQt5.QtWidgets import *
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import (Qt, QTimer, QAbstractTableModel, QModelIndex, QObject,
+                          QRunnable, QThreadPool, pyqtSignal)
 from PyQt5.QtGui import QIcon
 
-import pandas as pd
-
-# Matplotlib inside PyQt5
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-
 DB_NAME = "mini_inventory.db"
+# Default login (username: admin, password: admin123), hashed once at import
+DEFAULT_ADMIN_USERNAME = "admin"
+DEFAULT_ADMIN_HASH = hashlib.sha256(b"admin123").hexdigest()
+PRODUCT_COLUMNS = ["ID", "Name", "Category", "Quantity", "Price", "Added On"]
 
 # -----------------------
 # Database utilities
 # -----------------------
+_CONN = None
+_DB_LOCK = threading.Lock()
+
 def get_db_connection():
-    conn = sqlite3.connect(DB_NAME)
-    return conn
+    """Return the shared connection, opening it (and tuning PRAGMAs) on first use."""
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DB_NAME, check_same_thread=False, isolation_level=None)
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+        _CONN.execute("PRAGMA cache_size=-20000")
+    return _CONN
 
 def init_db():
     """Create products and users tables if not exist and add default admin user."""
     conn = get_db_connection()
-    cur = conn.cursor()
-    # Products table
+    with _DB_LOCK:
+        cur = conn.cursor()
+        # One transaction for schema + seed, so startup pays a single commit
+        cur.execute("BEGIN")
+        try:
+            # Products table
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS products (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    category TEXT,
+                    quantity INTEGER NOT NULL DEFAULT 0,
+                    price REAL NOT NULL DEFAULT 0.0,
+                    added_on TEXT
+                )
+            """)
+            # Users table
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL
+                )
+            """)
+            _migrate_products_not_null(cur)
+            # Indexes for the live search (prefix LIKE can use a NOCASE index)
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_products_name ON products(name COLLATE NOCASE)")
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_products_category ON products(category COLLATE NOCASE)")
+
+            # Insert default admin user
+            try:
+                cur.execute("INSERT OR IGNORE INTO users (id, username, password_hash) VALUES (?, ?, ?)",
+                            (1, DEFAULT_ADMIN_USERNAME, DEFAULT_ADMIN_HASH))
+            except Exception as e:
+                print("User insert error:", e)
+            cur.execute("COMMIT")
+        except Exception:
+            cur.execute("ROLLBACK")
+            raise
+
+def _migrate_products_not_null(cur):
+    """Rebuild a products table created before quantity/price were NOT NULL."""
+    cur.execute("PRAGMA table_info(products)")
+    notnull = {col[1]: col[3] for col in cur.fetchall()}
+    if notnull.get("quantity") and notnull.get("price"):
+        return
+    cur.execute("SELECT seq FROM sqlite_sequence WHERE name='products'")
+    seq = cur.fetchone()
+    cur.execute("DROP INDEX IF EXISTS idx_products_name")
+    cur.execute("DROP INDEX IF EXISTS idx_products_category")
+    cur.execute("ALTER TABLE products RENAME TO products_old")
     cur.execute("""
-        CREATE TABLE IF NOT EXISTS products (
+        CREATE TABLE products (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             category TEXT,
-            quantity INTEGER DEFAULT 0,
-            price REAL DEFAULT 0.0,
+            quantity INTEGER NOT NULL DEFAULT 0,
+            price REAL NOT NULL DEFAULT 0.0,
             added_on TEXT
         )
     """)
-    # Users table
-    cur.execute("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL
-        )
-    """)
-    conn.commit()
-
-    # Insert default admin user (username: admin, password: admin123)
-    default_username = "admin"
-    default_password = "admin123"
-    hashed = hashlib.sha256(default_password.encode()).hexdigest()
-    try:
-        cur.execute("INSERT OR IGNORE INTO users (id, username, password_hash) VALUES (?, ?, ?)",
-                    (1, default_username, hashed))
-        conn.commit()
-    except Exception as e:
-        print("User insert error:", e)
-    conn.close()
+    cur.execute("""INSERT INTO products (id, name, category, quantity, price, added_on)
+                   SELECT id, name, category, COALESCE(quantity, 0), COALESCE(price, 0.0), added_on
+                   FROM products_old""")
+    cur.execute("DROP TABLE products_old")
+    if seq:
+        # Keep AUTOINCREMENT from reusing ids of rows deleted before the migration
+        cur.execute("UPDATE sqlite_sequence SET seq=MAX(seq, ?) WHERE name='products'", (seq[0],))
 
 # Product CRUD
-def fetch_products(search_text=""):
-    conn = get_db_connection()
+def iter_products(search_text="", conn=None):
+    """Run the product query and return the cursor so callers can stream rows.
+
+    Uses the shared connection unless another one (e.g. a worker's) is given.
+    """
+    if conn is None:
+        conn = get_db_connection()
     cur = conn.cursor()
-    if search_text:
+    if search_text and not any(ch in search_text for ch in "%_"):
+        # Prefix search: each branch can walk its index instead of scanning the table
+        like = f"{search_text}%"
+        cur.execute("""SELECT id, name, category, quantity, price, added_on
+                       FROM products WHERE name LIKE ?
+                       UNION
+                       SELECT id, name, category, quantity, price, added_on
+                       FROM products WHERE category LIKE ?
+                       ORDER BY id DESC""", (like, like))
+    elif search_text:
+        # User typed their own wildcard - fall back to the full scan
         like = f"%{search_text}%"
         cur.execute("""SELECT id, name, category, quantity, price, added_on
                        FROM products
@@ -94,32 +155,70 @@ def fetch_products(search_text=""):
     else:
         cur.execute("""SELECT id, name, category, quantity, price, added_on
                        FROM products ORDER BY id DESC""")
-    rows = cur.fetchall()
-    conn.close()
+    return cur
+
+def fetch_products(search_text=""):
+    rows = iter_products(search_text).fetchall()
     return rows
 
+def fetch_dashboard_stats():
+    """Return (product_count, total_quantity, total_value) aggregated in SQL."""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    cur.execute("""SELECT COUNT(*), COALESCE(SUM(quantity), 0), COALESCE(SUM(quantity * price), 0)
+                   FROM products""")
+    return cur.fetchone()
+
+def fetch_top_categories(n=8):
+    """Return [(category, product_count), ...] for the n largest categories."""
+    conn = get_db_connection()
+    cur = conn.cursor()
+    cur.execute("""SELECT COALESCE(NULLIF(category, ''), 'Uncategorized'), COUNT(*)
+                   FROM products GROUP BY 1 ORDER BY 2 DESC LIMIT ?""", (n,))
+    return cur.fetchall()
+
 def insert_product(name, category, quantity, price):
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute("""INSERT INTO products (name, category, quantity, price, added_on)
-                       VALUES (?, ?, ?, ?, ?)""",
-                    (name, category, quantity, price, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-        conn.commit()
-        conn.close()
+        with _DB_LOCK:
+            cur = conn.cursor()
+            cur.execute("""INSERT INTO products (name, category, quantity, price, added_on)
+                           VALUES (?, ?, ?, ?, ?)""",
+                        (name, category, quantity, price, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
         return True
     except Exception as e:
         print("Insert product error:", e)
         return False
 
+def insert_products_many(rows):
+    """Bulk insert (name, category, quantity, price) tuples in a single transaction."""
+    added_on = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    try:
+        conn = get_db_connection()
+        with _DB_LOCK:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            try:
+                cur.executemany("""INSERT INTO products (name, category, quantity, price, added_on)
+                                   VALUES (?, ?, ?, ?, ?)""",
+                                ((name, category, quantity, price, added_on)
+                                 for name, category, quantity, price in rows))
+                cur.execute("COMMIT")
+            except Exception:
+                cur.execute("ROLLBACK")
+                raise
+        return True
+    except Exception as e:
+        print("Bulk insert error:", e)
+        return False
+
 def update_product(product_id, name, category, quantity, price):
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute("""UPDATE products SET name=?, category=?, quantity=?, price=?
-                       WHERE id=?""", (name, category, quantity, price, product_id))
-        conn.commit()
-        conn.close()
+        with _DB_LOCK:
+            cur = conn.cursor()
+            cur.execute("""UPDATE products SET name=?, category=?, quantity=?, price=?
+                           WHERE id=?""", (name, category, quantity, price, product_id))
         return True
     except Exception as e:
         print("Update product error:", e)
@@ -128,24 +227,41 @@ def update_product(product_id, name, category, quantity, price):
 def delete_product(product_id):
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
-        cur.execute("DELETE FROM products WHERE id=?", (product_id,))
-        conn.commit()
-        conn.close()
+        with _DB_LOCK:
+            cur = conn.cursor()
+            cur.execute("DELETE FROM products WHERE id=?", (product_id,))
         return True
     except Exception as e:
         print("Delete product error:", e)
         return False
 
+def delete_products(ids):
+    """Delete several products with a single DELETE ... WHERE id IN (...) statement."""
+    ids = list(ids)
+    if not ids:
+        return True
+    try:
+        conn = get_db_connection()
+        with _DB_LOCK:
+            cur = conn.cursor()
+            placeholders = ",".join("?" * len(ids))
+            cur.execute(f"DELETE FROM products WHERE id IN ({placeholders})", ids)
+        return True
+    except Exception as e:
+        print("Delete products error:", e)
+        return False
+
 # User auth
 def check_credentials(username, password):
     conn = get_db_connection()
     cur = conn.cursor()
-    hashed = hashlib.sha256(password.encode()).hexdigest()
-    cur.execute("SELECT id FROM users WHERE username=? AND password_hash=?", (username, hashed))
+    # Point lookup on the UNIQUE username index, then a constant-time compare
+    cur.execute("SELECT password_hash FROM users WHERE username=?", (username,))
     row = cur.fetchone()
-    conn.close()
-    return bool(row)
+    if not row:
+        return False
+    hashed = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(hashed, row[0])
 
 # -----------------------
 # Matplotlib Chart Widget
@@ -153,26 +269,126 @@ def check_credentials(username, password):
 class SimpleChart(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Matplotlib inside PyQt5 - imported here so the login dialog doesn't pay for it
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
         self.figure = Figure(figsize=(4, 3), tight_layout=True)
         self.canvas = FigureCanvas(self.figure)
+        self.ax = self.figure.add_subplot(111)
+        self._bars = None
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
 
     def plot_top_categories(self, category_counts):
-        """category_counts: dict or Counter {category: count}"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
+        """category_counts: dict {category: count}"""
+        ax = self.ax
+        categories = list(category_counts.keys())
+        counts = list(category_counts.values())
         if not category_counts:
+            ax.clear()
+            self._bars = None
             ax.text(0.5, 0.5, "No data", ha="center", va="center")
-        else:
-            categories = list(category_counts.keys())
-            counts = list(category_counts.values())
-            ax.bar(categories, counts)
+        elif self._bars is None or len(self._bars) != len(counts):
+            ax.clear()
+            self._bars = ax.bar(range(len(counts)), counts)
             ax.set_title("Top Categories (by number of products)")
             ax.set_ylabel("Count")
+            ax.set_xticks(range(len(categories)))
+            ax.set_xticklabels(categories, rotation=45, ha='right')
+        else:
+            # Same number of bars: reuse them and only move heights/labels
+            for bar, h in zip(self._bars, counts):
+                bar.set_height(h)
             ax.set_xticklabels(categories, rotation=45, ha='right')
-        self.canvas.draw()
+            ax.relim()
+            ax.autoscale_view()
+        self.canvas.draw_idle()
+
+# -----------------------
+# Products Table Model
+# -----------------------
+class ProductTableModel(QAbstractTableModel):
+    """Read-only model over the product row tuples; the view asks only for visible cells."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PRODUCT_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return PRODUCT_COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        val = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return str(val) if val is not None else ""
+        if role == Qt.UserRole:
+            # Raw typed value, so callers never parse the display text back
+            return val
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+# -----------------------
+# Background Export
+# -----------------------
+def write_products_csv(path, rows):
+    # Stream rows straight from the cursor, no intermediate list
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(PRODUCT_COLUMNS)
+        w.writerows(rows)
+
+def write_products_xlsx(path, rows):
+    # This requires openpyxl installed
+    from openpyxl import Workbook
+    # Write-only mode streams rows into the file instead of holding the sheet
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    ws.append(PRODUCT_COLUMNS)
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+class ExportTask(QRunnable):
+    """Export products on a QThreadPool worker with its own read-only connection."""
+    def __init__(self, path, writer, search_text=""):
+        super().__init__()
+        self.path = path
+        self.writer = writer
+        self.search_text = search_text
+        self.signals = ExportSignals()
+
+    def run(self):
+        try:
+            conn = sqlite3.connect(f"file:{DB_NAME}?mode=ro", uri=True)
+            try:
+                self.writer(self.path, iter_products(self.search_text, conn))
+            finally:
+                conn.close()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(self.path)
 
 # -----------------------
 # Login Dialog (L1)
@@ -241,6 +457,7 @@ class InventoryApp(QMainWindow):
         self.setWindowTitle("Mini Inventory System")
         self.setGeometry(120, 80, 920, 620)  # compact for S
         self._selected_product_id = None
+        self._export_tasks = set()
         self.setup_ui()
 
     def setup_ui(self):
@@ -283,8 +500,7 @@ class InventoryApp(QMainWindow):
         self.statusBar().showMessage("Ready")
 
         # Initial load
-        self.load_table()
-        self.update_dashboard()
+        self.load_table(data_changed=True)
 
     # -----------------------
     # Dashboard
@@ -315,19 +531,14 @@ class InventoryApp(QMainWindow):
         layout.addWidget(self.chart_widget, stretch=1)
 
     def update_dashboard(self):
-        rows = fetch_products()
-        total_products = len(rows)
-        total_quantity = sum(int(r[3] or 0) for r in rows)
-        total_value = sum((int(r[3] or 0) * float(r[4] or 0.0)) for r in rows)
+        total_products, total_quantity, total_value = fetch_dashboard_stats()
 
         self.total_products_label.setText(f"Total Products: {total_products}")
         self.total_quantity_label.setText(f"Total Quantity: {total_quantity}")
         self.total_value_label.setText(f"Total Value: ${total_value:.2f}")
 
         # Top categories chart
-        categories = [ (r[2] or "Uncategorized") for r in rows ]
-        counts = Counter(categories)
-        top_counts = dict(counts.most_common(8))
+        top_counts = dict(fetch_top_categories(8))
         self.chart_widget.plot_top_categories(top_counts)
 
     # -----------------------
@@ -373,21 +584,31 @@ class InventoryApp(QMainWindow):
         # Search + table
         tool_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by name or category...")
-        self.search_input.textChanged.connect(self.load_table)
+        self.search_input.setPlaceholderText("Search by name or category prefix...")
+        # Debounce typing so only the last keystroke triggers a query + table rebuild
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(200)
+        self._search_timer.timeout.connect(self.load_table)
+        self.search_input.textChanged.connect(lambda _text: self._search_timer.start())
         tool_layout.addWidget(QLabel("Search:"))
         tool_layout.addWidget(self.search_input)
         tool_layout.addStretch()
         layout.addLayout(tool_layout)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "Name", "Category", "Quantity", "Price", "Added On"])
-        self.table.horizontalHeader().setStretchLastSection(True)
+        self.model = ProductTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed/stretch sections, so refreshing never walks every cell to measure widths
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(110)
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(5, QHeaderView.Stretch)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.table.cellClicked.connect(self.table_row_clicked)
+        self.table.clicked.connect(self.table_row_clicked)
         layout.addWidget(self.table, 1)
 
         # Delete
@@ -398,37 +619,25 @@ class InventoryApp(QMainWindow):
         bottom.addWidget(self.delete_btn)
         layout.addLayout(bottom)
 
-    def load_table(self):
+    def load_table(self, data_changed=False):
         s = self.search_input.text().strip()
         rows = fetch_products(s)
-        self.table.setRowCount(len(rows))
-        for r_idx, row in enumerate(rows):
-            for c_idx, val in enumerate(row):
-                item = QTableWidgetItem(str(val) if val is not None else "")
-                if c_idx == 0:
-                    item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsSelectable)
-                self.table.setItem(r_idx, c_idx, item)
-        self.table.resizeColumnsToContents()
+        # One model reset instead of a QTableWidgetItem per cell
+        self.model.set_rows(rows)
         self._selected_product_id = None
-        # Update dashboard whenever table changes
-        self.update_dashboard()
+        # Searching does not change the data, so only refresh totals after edits
+        if data_changed:
+            self.update_dashboard()
 
-    def table_row_clicked(self, row, column):
+    def table_row_clicked(self, index):
         try:
-            id_item = self.table.item(row, 0)
-            name_item = self.table.item(row, 1)
-            cat_item = self.table.item(row, 2)
-            qty_item = self.table.item(row, 3)
-            price_item = self.table.item(row, 4)
-            if id_item:
-                self._selected_product_id = int(id_item.text())
-                self.name_input.setText(name_item.text() if name_item else "")
-                self.category_input.setText(cat_item.text() if cat_item else "")
-                self.quantity_input.setValue(int(qty_item.text()) if qty_item and qty_item.text().isdigit() else 0)
-                try:
-                    self.price_input.setValue(float(price_item.text()))
-                except Exception:
-                    self.price_input.setValue(0.0)
+            product_id, name, category, qty, price = (
+                index.sibling(index.row(), col).data(Qt.UserRole) for col in range(5))
+            self._selected_product_id = product_id
+            self.name_input.setText(name or "")
+            self.category_input.setText(category or "")
+            self.quantity_input.setValue(qty)
+            self.price_input.setValue(price)
         except Exception as e:
             print("Row click error:", e)
 
@@ -444,7 +653,7 @@ class InventoryApp(QMainWindow):
         if ok:
             QMessageBox.information(self, "Added", "Product added.")
             self.clear_form()
-            self.load_table()
+            self.load_table(data_changed=True)
         else:
             QMessageBox.critical(self, "Error", "Failed to add product.")
 
@@ -463,21 +672,28 @@ class InventoryApp(QMainWindow):
         if ok:
             QMessageBox.information(self, "Updated", "Product updated.")
             self.clear_form()
-            self.load_table()
+            self.load_table(data_changed=True)
         else:
             QMessageBox.critical(self, "Error", "Failed to update product.")
 
     def handle_delete(self):
-        if not self._selected_product_id:
+        ids = [index.data(Qt.UserRole) for index in self.table.selectionModel().selectedRows()]
+        if not ids and self._selected_product_id:
+            ids = [self._selected_product_id]
+        if not ids:
             QMessageBox.warning(self, "Select", "Select a product to delete.")
             return
-        reply = QMessageBox.question(self, "Confirm", "Delete selected product?", QMessageBox.Yes | QMessageBox.No)
+        if len(ids) == 1:
+            question = "Delete selected product?"
+        else:
+            question = f"Delete {len(ids)} selected products?"
+        reply = QMessageBox.question(self, "Confirm", question, QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            ok = delete_product(self._selected_product_id)
+            ok = delete_products(ids)
             if ok:
-                QMessageBox.information(self, "Deleted", "Product deleted.")
+                QMessageBox.information(self, "Deleted", "Product deleted." if len(ids) == 1 else "Products deleted.")
                 self.clear_form()
-                self.load_table()
+                self.load_table(data_changed=True)
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete product.")
 
@@ -512,35 +728,39 @@ class InventoryApp(QMainWindow):
         layout.addStretch()
 
     def export_csv(self):
-        rows = fetch_products(self.search_input.text().strip())
-        if not rows:
-            QMessageBox.warning(self, "No data", "No products to export.")
-            return
-        df = pd.DataFrame(rows, columns=["ID", "Name", "Category", "Quantity", "Price", "Added On"])
-        default = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        path, _ = QFileDialog.getSaveFileName(self, "Save CSV", default, "CSV Files (*.csv)")
-        if path:
-            try:
-                df.to_csv(path, index=False)
-                QMessageBox.information(self, "Exported", f"CSV saved: {path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Export failed: {e}")
+        self._start_export("CSV", ".csv", "CSV Files (*.csv)", write_products_csv,
+                           "Export failed: {}")
 
     def export_excel(self):
-        rows = fetch_products(self.search_input.text().strip())
-        if not rows:
+        self._start_export("Excel", ".xlsx", "Excel Files (*.xlsx)", write_products_xlsx,
+                           "Excel export failed: {}\nMake sure 'openpyxl' is installed.")
+
+    def _start_export(self, label, ext, file_filter, writer, error_text):
+        search_text = self.search_input.text().strip()
+        if iter_products(search_text).fetchone() is None:
             QMessageBox.warning(self, "No data", "No products to export.")
             return
-        df = pd.DataFrame(rows, columns=["ID", "Name", "Category", "Quantity", "Price", "Added On"])
-        default = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-        path, _ = QFileDialog.getSaveFileName(self, "Save Excel", default, "Excel Files (*.xlsx)")
-        if path:
-            try:
-                # This requires openpyxl installed
-                df.to_excel(path, index=False)
-                QMessageBox.information(self, "Exported", f"Excel saved: {path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Excel export failed: {e}\nMake sure 'openpyxl' is installed.")
+        default = f"inventory_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+        path, _ = QFileDialog.getSaveFileName(self, f"Save {label}", default, file_filter)
+        if not path:
+            return
+        # Write on a pool thread so the UI stays responsive; results come back as signals
+        task = ExportTask(path, writer, search_text)
+        self._export_tasks.add(task)
+        task.signals.finished.connect(
+            lambda p: self._export_done(task, "Exported", f"{label} saved: {p}"))
+        task.signals.failed.connect(
+            lambda err: self._export_done(task, "Error", error_text.format(err), failed=True))
+        self.statusBar().showMessage(f"Exporting {label}...")
+        QThreadPool.globalInstance().start(task)
+
+    def _export_done(self, task, title, message, failed=False):
+        self._export_tasks.discard(task)
+        self.statusBar().showMessage("Ready")
+        if failed:
+            QMessageBox.critical(self, title, message)
+        else:
+            QMessageBox.information(self, title, message)
 
     # -----------------------
     # Logout